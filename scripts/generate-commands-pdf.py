@@ -3,24 +3,51 @@
 Generate PDF documentation from COMMANDS_REFERENCE.md
 """
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, KeepTogether
-)
 from reportlab.lib import colors
+from reportlab import Version as REPORTLAB_VERSION
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+import hashlib
 import os
+import re
+import sys
 
 # Colors
 PRIMARY_COLOR = HexColor('#2563eb')
 SECONDARY_COLOR = HexColor('#64748b')
+ACCENT_COLOR = HexColor('#1e40af')
 CODE_BG = HexColor('#f1f5f9')
 
+# Defaults for create_pdf(); a config dict passed in overrides these
+DEFAULT_CONFIG = {
+    'version': '2.5.0',
+}
+
+# Table column widths
+QUICK_REFERENCE_WIDTHS = (1.5*inch, 2*inch, 2.5*inch)
+
+# List item formats for list_markup()
+BULLET = '&bull; {item}'
+NUMBERED = '{i}. {item}'
+
+def list_markup(items, item_format='{item}'):
+    """Join list items into the markup for a single Paragraph."""
+    return '<br/>'.join(item_format.format(i=i, item=item) for i, item in enumerate(items, 1))
+
+@lru_cache(maxsize=None)
 def create_styles():
-    """Create custom paragraph styles."""
+    """Create custom paragraph styles (built once and reused across builds)."""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.pdfbase import pdfmetrics
+
+    # Register the fonts these styles use alongside the styles themselves
+    for font_name in ('Helvetica', 'Helvetica-Bold', 'Courier'):
+        pdfmetrics.getFont(font_name)
+
     styles = getSampleStyleSheet()
 
     styles.add(ParagraphStyle(
@@ -32,6 +59,14 @@ def create_styles():
         alignment=1  # Center
     ))
 
+    styles.add(ParagraphStyle(
+        'Subtitle',
+        parent=styles['Normal'],
+        fontSize=14,
+        textColor=SECONDARY_COLOR,
+        alignment=1
+    ))
+
     styles.add(ParagraphStyle(
         'CustomHeading1',
         parent=styles['Heading1'],
@@ -48,7 +83,7 @@ def create_styles():
         'CustomHeading2',
         parent=styles['Heading2'],
         fontSize=13,
-        textColor=HexColor('#1e40af'),
+        textColor=ACCENT_COLOR,
         spaceBefore=15,
         spaceAfter=8
     ))
@@ -83,44 +118,33 @@ def create_styles():
 
     return styles
 
-def create_pdf():
-    """Generate the PDF document."""
-    output_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        'docs',
-        'COMMANDS_REFERENCE.pdf'
-    )
+def build_title_page(styles, context):
+    """Title page with version and generation date."""
+    from reportlab.platypus import Paragraph, Spacer
 
-    doc = SimpleDocTemplate(
-        output_path,
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch
-    )
-
-    styles = create_styles()
     story = []
-
-    # Title Page
     story.append(Spacer(1, 2*inch))
     story.append(Paragraph('Slash Commands Reference', styles['CustomTitle']))
     story.append(Spacer(1, 0.3*inch))
     story.append(Paragraph(
         '<b>antigravity-jules-orchestration</b>',
-        ParagraphStyle('Subtitle', parent=styles['Normal'], fontSize=14, alignment=1, textColor=SECONDARY_COLOR)
+        styles['Subtitle']
     ))
     story.append(Spacer(1, 0.2*inch))
     story.append(Paragraph(
-        f'Version 2.5.0 | Generated: {datetime.now().strftime("%Y-%m-%d")}',
+        f'Version {context["config"]["version"]} | Generated: {context["generated_at"]:%Y-%m-%d}',
         styles['Footer']
     ))
-    story.append(PageBreak())
+    story.append(context['page_break'])
+    return story
+
+def build_table_of_contents(styles, context):
+    """Table of contents."""
+    from reportlab.platypus import Paragraph
 
-    # Table of Contents
+    story = []
     story.append(Paragraph('Table of Contents', styles['CustomHeading1']))
-    toc_items = [
+    toc_items = (
         '1. Core Commands',
         '   - /status, /quick-fix, /session, /batch',
         '2. Workflow Commands',
@@ -132,160 +156,183 @@ def create_pdf():
         '5. Quick Reference Table',
         '6. Recommended Workflows',
         '7. MCP Tools Integration',
-    ]
-    for item in toc_items:
-        story.append(Paragraph(item, styles['BulletItem']))
-    story.append(PageBreak())
-
-    # Core Commands Section
-    story.append(Paragraph('1. Core Commands', styles['CustomHeading1']))
-
-    # /status
-    story.append(Paragraph('/status', styles['CustomHeading2']))
-    story.append(Paragraph(
+    )
+    story.append(Paragraph(list_markup(toc_items), styles['BulletItem']))
+    story.append(context['page_break'])
+    return story
+
+@dataclass(frozen=True, slots=True)
+class Section:
+    """One command entry on a command reference page.
+
+    Rendered in field order: heading, description, example, an optional
+    captioned bullet list and an optional closing note.
+    """
+    title: str
+    intro: str
+    code: str | None = None
+    label: str | None = None
+    bullets: tuple = ()
+    item_format: str = BULLET
+    note: str | None = None
+
+    def __post_init__(self):
+        # The label is the caption for the bullet list; one without the other renders wrong
+        if bool(self.label) != bool(self.bullets):
+            raise ValueError(f'Section {self.title!r}: label and bullets must be set together')
+
+CORE_COMMANDS = (
+    Section(
+        '/status',
         'Get a comprehensive overview of all Jules sessions, system health, and orchestration status.',
-        styles['Normal']
-    ))
-    story.append(Paragraph('<font face="Courier">/status</font>', styles['CodeBlock']))
-    story.append(Paragraph('<b>Output:</b>', styles['Normal']))
-    for item in ['Active sessions with state', 'Session statistics (total, completed, in progress, failed)',
-                 'System health (circuit breaker, cache, rate limits)', 'Quick action suggestions']:
-        story.append(Paragraph(f'&bull; {item}', styles['BulletItem']))
-    story.append(Spacer(1, 0.2*inch))
-
-    # /quick-fix
-    story.append(Paragraph('/quick-fix [file] [description]', styles['CustomHeading2']))
-    story.append(Paragraph(
+        code='/status',
+        label='Output:',
+        bullets=('Active sessions with state', 'Session statistics (total, completed, in progress, failed)',
+                 'System health (circuit breaker, cache, rate limits)', 'Quick action suggestions'),
+    ),
+    Section(
+        '/quick-fix [file] [description]',
         'Fast, streamlined workflow for single-file fixes using Jules autonomous coding.',
-        styles['Normal']
-    ))
-    story.append(Paragraph(
-        '<font face="Courier">/quick-fix src/api/auth.js "Add rate limiting"</font>',
-        styles['CodeBlock']
-    ))
-    story.append(Paragraph('<b>Features:</b>', styles['Normal']))
-    for item in ['Auto-selects repository', 'Creates focused session', 'Skips plan approval for speed', 'Auto-creates PR']:
-        story.append(Paragraph(f'&bull; {item}', styles['BulletItem']))
-    story.append(Spacer(1, 0.2*inch))
-
-    # /session
-    story.append(Paragraph('/session [id] [action]', styles['CustomHeading2']))
-    story.append(Paragraph('Quick session management for Jules coding sessions.', styles['Normal']))
-    story.append(Paragraph(
-        '<font face="Courier">/session ses_abc123 approve</font>',
-        styles['CodeBlock']
-    ))
-    story.append(Paragraph('<b>Actions:</b> view (default), approve, cancel, retry, diff', styles['Normal']))
-    story.append(Spacer(1, 0.2*inch))
-
-    # /batch
-    story.append(Paragraph('/batch [label] [repo?]', styles['CustomHeading2']))
-    story.append(Paragraph('Quick batch session creation from GitHub issue labels.', styles['Normal']))
-    story.append(Paragraph(
-        '<font face="Courier">/batch jules-auto</font>',
-        styles['CodeBlock']
-    ))
-    story.append(Paragraph('<b>Common Labels:</b> jules-auto, bug, enhancement, security', styles['Normal']))
-    story.append(PageBreak())
-
-    # Workflow Commands Section
-    story.append(Paragraph('2. Workflow Commands', styles['CustomHeading1']))
-
-    # /audit
-    story.append(Paragraph('/audit', styles['CustomHeading2']))
-    story.append(Paragraph('Run a comprehensive parallel audit of the entire repository.', styles['Normal']))
-    story.append(Paragraph('<b>Parallel Agents:</b>', styles['Normal']))
-    agents = [
-        'Security Audit - vulnerabilities, secrets, auth patterns',
-        'Code Quality Review - error handling, async patterns, style',
-        'Dependency Analysis - outdated, vulnerabilities, unused',
-        'API Endpoint Review - validation, status codes, rate limiting',
-        'Documentation Completeness - accuracy, coverage'
-    ]
-    for i, agent in enumerate(agents, 1):
-        story.append(Paragraph(f'{i}. {agent}', styles['BulletItem']))
-    story.append(Spacer(1, 0.2*inch))
-
-    # /deploy-check
-    story.append(Paragraph('/deploy-check', styles['CustomHeading2']))
-    story.append(Paragraph('Pre-deployment validation with live health checks.', styles['Normal']))
-    story.append(Paragraph('<b>Checks:</b>', styles['Normal']))
-    for item in ['Git status (uncommitted changes)', 'All tests passing', 'No high/critical vulnerabilities',
-                 'Health endpoint responding', 'All services configured']:
-        story.append(Paragraph(f'&bull; {item}', styles['BulletItem']))
-    story.append(Spacer(1, 0.2*inch))
-
-    # /implement-feature
-    story.append(Paragraph('/implement-feature [description]', styles['CustomHeading2']))
-    story.append(Paragraph('Feature implementation workflow with planning.', styles['Normal']))
-    story.append(Paragraph(
-        '<font face="Courier">/implement-feature "Add webhook retry mechanism"</font>',
-        styles['CodeBlock']
-    ))
-    story.append(Paragraph('<b>Steps:</b> Analyze requirements, Create plan, Generate code, Create tests, Update docs', styles['Normal']))
-    story.append(Spacer(1, 0.2*inch))
+        code='/quick-fix src/api/auth.js "Add rate limiting"',
+        label='Features:',
+        bullets=('Auto-selects repository', 'Creates focused session', 'Skips plan approval for speed', 'Auto-creates PR'),
+    ),
+    Section(
+        '/session [id] [action]',
+        'Quick session management for Jules coding sessions.',
+        code='/session ses_abc123 approve',
+        note='<b>Actions:</b> view (default), approve, cancel, retry, diff',
+    ),
+    Section(
+        '/batch [label] [repo?]',
+        'Quick batch session creation from GitHub issue labels.',
+        code='/batch jules-auto',
+        note='<b>Common Labels:</b> jules-auto, bug, enhancement, security',
+    ),
+)
 
-    # /fix-issues
-    story.append(Paragraph('/fix-issues', styles['CustomHeading2']))
-    story.append(Paragraph('Auto-diagnose and fix common issues.', styles['Normal']))
-    story.append(Paragraph('<b>Fixes:</b> TypeScript errors, Linting issues, Failing tests, Outdated dependencies, Missing imports', styles['Normal']))
-    story.append(PageBreak())
+WORKFLOW_COMMANDS = (
+    Section(
+        '/audit',
+        'Run a comprehensive parallel audit of the entire repository.',
+        label='Parallel Agents:',
+        bullets=(
+            'Security Audit - vulnerabilities, secrets, auth patterns',
+            'Code Quality Review - error handling, async patterns, style',
+            'Dependency Analysis - outdated, vulnerabilities, unused',
+            'API Endpoint Review - validation, status codes, rate limiting',
+            'Documentation Completeness - accuracy, coverage'
+        ),
+        item_format=NUMBERED,
+    ),
+    Section(
+        '/deploy-check',
+        'Pre-deployment validation with live health checks.',
+        label='Checks:',
+        bullets=('Git status (uncommitted changes)', 'All tests passing', 'No high/critical vulnerabilities',
+                 'Health endpoint responding', 'All services configured'),
+    ),
+    Section(
+        '/implement-feature [description]',
+        'Feature implementation workflow with planning.',
+        code='/implement-feature "Add webhook retry mechanism"',
+        note='<b>Steps:</b> Analyze requirements, Create plan, Generate code, Create tests, Update docs',
+    ),
+    Section(
+        '/fix-issues',
+        'Auto-diagnose and fix common issues.',
+        note='<b>Fixes:</b> TypeScript errors, Linting issues, Failing tests, Outdated dependencies, Missing imports',
+    ),
+)
 
-    # Security & Testing Section
-    story.append(Paragraph('3. Security & Testing', styles['CustomHeading1']))
+SECURITY_COMMANDS = (
+    Section(
+        '/security [scope]',
+        'Dedicated security scanning.',
+        code='/security quick',
+        label='Scope Options:',
+        bullets=('full - Complete security audit (default)', 'quick - Critical issues only',
+                 'deps - npm audit', 'secrets - Credential scanning', 'api - Endpoint security testing'),
+    ),
+    Section(
+        '/test [scope] [options]',
+        'Run all tests with coverage and detailed reporting.',
+        code='/test all --coverage',
+        note='<b>Scope:</b> all (default), backend, dashboard, unit, integration',
+    ),
+)
 
-    # /security
-    story.append(Paragraph('/security [scope]', styles['CustomHeading2']))
-    story.append(Paragraph('Dedicated security scanning.', styles['Normal']))
-    story.append(Paragraph(
-        '<font face="Courier">/security quick</font>',
-        styles['CodeBlock']
-    ))
-    story.append(Paragraph('<b>Scope Options:</b>', styles['Normal']))
-    scopes = ['full - Complete security audit (default)', 'quick - Critical issues only',
-              'deps - npm audit', 'secrets - Credential scanning', 'api - Endpoint security testing']
-    for scope in scopes:
-        story.append(Paragraph(f'&bull; {scope}', styles['BulletItem']))
-    story.append(Spacer(1, 0.2*inch))
+def render_section(section, styles):
+    """Flowables for a single command entry."""
+    from reportlab.platypus import Paragraph
 
-    # /test
-    story.append(Paragraph('/test [scope] [options]', styles['CustomHeading2']))
-    story.append(Paragraph('Run all tests with coverage and detailed reporting.', styles['Normal']))
-    story.append(Paragraph(
-        '<font face="Courier">/test all --coverage</font>',
-        styles['CodeBlock']
-    ))
-    story.append(Paragraph('<b>Scope:</b> all (default), backend, dashboard, unit, integration', styles['Normal']))
-    story.append(PageBreak())
+    story = [
+        Paragraph(section.title, styles['CustomHeading2']),
+        Paragraph(section.intro, styles['Normal']),
+    ]
+    if section.code:
+        story.append(Paragraph(section.code, styles['CodeBlock']))
+    if section.bullets:
+        story.append(Paragraph(f'<b>{section.label}</b>', styles['Normal']))
+        story.append(Paragraph(list_markup(section.bullets, section.item_format), styles['BulletItem']))
+    if section.note:
+        story.append(Paragraph(section.note, styles['Normal']))
+    return story
+
+def render_command_page(heading, sections, styles, context):
+    """A page of command entries under a numbered heading."""
+    from reportlab.platypus import Paragraph, Spacer
+
+    story = [Paragraph(heading, styles['CustomHeading1'])]
+    for i, section in enumerate(sections):
+        if i:
+            story.append(Spacer(1, 0.2*inch))
+        story.extend(render_section(section, styles))
+    story.append(context['page_break'])
+    return story
+
+def build_core_commands(styles, context):
+    """Section 1: core commands."""
+    return render_command_page('1. Core Commands', CORE_COMMANDS, styles, context)
+
+def build_workflow_commands(styles, context):
+    """Section 2: workflow commands."""
+    return render_command_page('2. Workflow Commands', WORKFLOW_COMMANDS, styles, context)
+
+def build_security_commands(styles, context):
+    """Section 3: security and testing commands."""
+    return render_command_page('3. Security & Testing', SECURITY_COMMANDS, styles, context)
+
+def build_quick_reference(styles, context):
+    """Section 4: quick reference table."""
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
 
-    # Quick Reference Table
+    story = []
     story.append(Paragraph('4. Quick Reference Table', styles['CustomHeading1']))
     story.append(Spacer(1, 0.1*inch))
 
-    table_data = [
-        ['Command', 'Purpose', 'Example'],
-        ['/status', 'System overview', '/status'],
-        ['/quick-fix', 'Fast single-file fix', '/quick-fix file.js "fix"'],
-        ['/session', 'Session management', '/session id approve'],
-        ['/batch', 'Batch from labels', '/batch jules-auto'],
-        ['/audit', 'Full audit', '/audit'],
-        ['/deploy-check', 'Pre-deploy validation', '/deploy-check'],
-        ['/implement-feature', 'Feature workflow', '/implement-feature "X"'],
-        ['/fix-issues', 'Auto-fix problems', '/fix-issues'],
-        ['/security', 'Security scan', '/security quick'],
-        ['/test', 'Run tests', '/test all'],
-    ]
+    table_data = (
+        ('Command', 'Purpose', 'Example'),
+        ('/status', 'System overview', '/status'),
+        ('/quick-fix', 'Fast single-file fix', '/quick-fix file.js "fix"'),
+        ('/session', 'Session management', '/session id approve'),
+        ('/batch', 'Batch from labels', '/batch jules-auto'),
+        ('/audit', 'Full audit', '/audit'),
+        ('/deploy-check', 'Pre-deploy validation', '/deploy-check'),
+        ('/implement-feature', 'Feature workflow', '/implement-feature "X"'),
+        ('/fix-issues', 'Auto-fix problems', '/fix-issues'),
+        ('/security', 'Security scan', '/security quick'),
+        ('/test', 'Run tests', '/test all'),
+    )
 
-    table = Table(table_data, colWidths=[1.5*inch, 2*inch, 2.5*inch])
+    table = Table(table_data, colWidths=QUICK_REFERENCE_WIDTHS)
     table.setStyle(TableStyle([
         ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
         ('FONTSIZE', (0, 0), (-1, 0), 10),
         ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
         ('TOPPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
         ('FONTNAME', (0, 1), (0, -1), 'Courier'),
         ('FONTSIZE', (0, 1), (-1, -1), 9),
         ('GRID', (0, 0), (-1, -1), 0.5, SECONDARY_COLOR),
@@ -294,33 +341,42 @@ def create_pdf():
         ('TOPPADDING', (0, 1), (-1, -1), 6),
     ]))
     story.append(table)
-    story.append(PageBreak())
+    story.append(context['page_break'])
+    return story
 
-    # Recommended Workflows
+def build_workflows(styles, context):
+    """Section 5: recommended workflows."""
+    from reportlab.platypus import Paragraph, Spacer
+
+    story = []
     story.append(Paragraph('5. Recommended Workflows', styles['CustomHeading1']))
 
     workflows = [
-        ('Daily Development', ['1. /status - Check orchestration state', '2. /quick-fix - Make targeted fixes',
-                               '3. /test - Verify changes', '4. /deploy-check - Pre-deployment validation']),
-        ('Batch Processing', ['1. /batch jules-auto - Process labeled issues', '2. /status - Monitor progress',
-                              '3. /session [id] - Review individual sessions', '4. /session [id] approve - Approve plans']),
-        ('Security Review', ['1. /security quick - Fast critical scan', '2. /security deps - Check dependencies',
-                             '3. /audit - Full comprehensive audit', '4. /fix-issues - Auto-fix what\'s possible']),
-        ('Feature Implementation', ['1. /implement-feature - Plan and implement', '2. /test - Verify tests pass',
-                                    '3. /security - Security check', '4. /deploy-check - Ready for deployment']),
+        ('Daily Development', ('1. /status - Check orchestration state', '2. /quick-fix - Make targeted fixes',
+                               '3. /test - Verify changes', '4. /deploy-check - Pre-deployment validation')),
+        ('Batch Processing', ('1. /batch jules-auto - Process labeled issues', '2. /status - Monitor progress',
+                              '3. /session [id] - Review individual sessions', '4. /session [id] approve - Approve plans')),
+        ('Security Review', ('1. /security quick - Fast critical scan', '2. /security deps - Check dependencies',
+                             '3. /audit - Full comprehensive audit', '4. /fix-issues - Auto-fix what\'s possible')),
+        ('Feature Implementation', ('1. /implement-feature - Plan and implement', '2. /test - Verify tests pass',
+                                    '3. /security - Security check', '4. /deploy-check - Ready for deployment')),
     ]
 
     for title, steps in workflows:
         story.append(Paragraph(title, styles['CustomHeading2']))
-        for step in steps:
-            story.append(Paragraph(step, styles['BulletItem']))
+        story.append(Paragraph(list_markup(steps), styles['BulletItem']))
         story.append(Spacer(1, 0.15*inch))
-    story.append(PageBreak())
+    story.append(context['page_break'])
+    return story
+
+def build_mcp_tools(styles, context):
+    """Section 6: MCP tools integration."""
+    from reportlab.platypus import Paragraph, Spacer
 
-    # MCP Tools Integration
+    story = []
     story.append(Paragraph('6. MCP Tools Integration', styles['CustomHeading1']))
     story.append(Paragraph(
-        'These commands leverage the 45 MCP tools available in v2.5.0:',
+        f'These commands leverage the 45 MCP tools available in v{context["config"]["version"]}:',
         styles['Normal']
     ))
     story.append(Spacer(1, 0.1*inch))
@@ -343,13 +399,109 @@ def create_pdf():
         story.append(Paragraph(f'<b>{category}:</b>', styles['Normal']))
         story.append(Paragraph(f'<font face="Courier" size="8">{tools}</font>', styles['BulletItem']))
         story.append(Spacer(1, 0.08*inch))
+    return story
+
+def build_footer(styles, context):
+    """Closing footer with build timestamp."""
+    from reportlab.platypus import Paragraph, Spacer
 
-    # Footer
+    story = []
     story.append(Spacer(1, 0.5*inch))
     story.append(Paragraph(
-        f'Generated by antigravity-jules-orchestration v2.5.0 | {datetime.now().strftime("%Y-%m-%d %H:%M")} | https://scarmonit.com',
+        f'Generated by antigravity-jules-orchestration v{context["config"]["version"]} | '
+        f'{context["generated_at"]:%Y-%m-%d %H:%M} | https://scarmonit.com',
         styles['Footer']
     ))
+    return story
+
+# Page builders in document order; each returns the flowables for its pages
+PAGE_BUILDERS = (
+    build_title_page,
+    build_table_of_contents,
+    build_core_commands,
+    build_workflow_commands,
+    build_security_commands,
+    build_quick_reference,
+    build_workflows,
+    build_mcp_tools,
+    build_footer,
+)
+
+def content_hash(config):
+    """Hash everything that determines the document apart from its timestamp.
+
+    All of the document's content lives in this file, so its source stands in
+    for the content itself.
+    """
+    digest = hashlib.sha256()
+    with open(__file__, 'rb') as source:
+        digest.update(source.read())
+    digest.update(REPORTLAB_VERSION.encode())
+    digest.update(repr(sorted(config.items())).encode())
+    return digest.hexdigest()
+
+def embedded_hash(pdf_path):
+    """Return the content hash stored in a generated PDF's Keywords entry, or None."""
+    try:
+        with open(pdf_path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    match = re.search(rb'/Keywords \(content-sha256:([0-9a-f]{64})\)', data)
+    return match.group(1).decode() if match else None
+
+def create_pdf(output_path=None, config=None, force=False):
+    """Generate the PDF document.
+
+    output_path defaults to docs/COMMANDS_REFERENCE.pdf; config overrides
+    keys in DEFAULT_CONFIG. The build is skipped when the existing PDF's
+    embedded content hash matches, unless force is set.
+    """
+    if output_path is None:
+        output_path = os.path.join(
+            os.path.dirname(os.path.dirname(__file__)),
+            'docs',
+            'COMMANDS_REFERENCE.pdf'
+        )
+
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    digest = content_hash(config)
+    if not force and embedded_hash(output_path) == digest:
+        print(f'PDF up to date: {output_path}')
+        return output_path
+
+    # platypus dominates reportlab's import time; only load it when building
+    from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, PageBreak
+
+    # One explicit Frame/PageTemplate; no SimpleDocTemplate First/Later template switching
+    doc = BaseDocTemplate(
+        output_path,
+        pagesize=letter,
+        rightMargin=0.75*inch,
+        leftMargin=0.75*inch,
+        topMargin=0.75*inch,
+        bottomMargin=0.75*inch,
+        pageCompression=0,  # skip zlib on content streams; size is not a concern here
+        keywords=f'content-sha256:{digest}'
+    )
+    frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='normal')
+    doc.addPageTemplates([PageTemplate(id='Page', frames=[frame])])
+
+    styles = create_styles()
+
+    # One timestamp for the whole build so the title page and footer agree
+    # PageBreak is handled by doc.build() as a page-break action and never gets
+    # layout state, so one instance is shared. Spacers are created fresh at each
+    # use: doc.build() marks a flowable that misses a frame bottom as _postponed,
+    # and a shared Spacer reaching a frame bottom again then raises LayoutError.
+    # User config sits under its own key so it can never shadow build-time objects.
+    context = {
+        'config': config,
+        'generated_at': datetime.now(),
+        'page_break': PageBreak(),
+    }
+
+    story = list(chain.from_iterable(build(styles, context) for build in PAGE_BUILDERS))
 
     # Build PDF
     doc.build(story)
@@ -357,4 +509,4 @@ def create_pdf():
     return output_path
 
 if __name__ == '__main__':
-    create_pdf()
+    create_pdf(force='--force' in sys.argv[1:])
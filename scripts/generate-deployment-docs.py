@@ -5,208 +5,257 @@ Domain Migration: antigravity-jules-orchestration.onrender.com -> scarmonit.com
 """
 
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib import colors
+from reportlab import Version as REPORTLAB_VERSION
 from datetime import datetime
+from functools import lru_cache
+import hashlib
 import os
+import re
+import sys
+
+# Colors
+DARK_COLOR = HexColor('#1a1a2e')
+NAVY_COLOR = HexColor('#16213e')
+BLUE_COLOR = HexColor('#0f3460')
+ROW_BG = HexColor('#f8f9fa')
+GRID_COLOR = HexColor('#dee2e6')
+CODE_BG = HexColor('#f5f5f5')
+
+# Table column widths
+MIGRATION_WIDTHS = (1.5*inch, 2.5*inch, 2*inch)
+ARCH_WIDTHS = (1.5*inch, 1.8*inch, 2.7*inch)
+ENV_WIDTHS = (2.5*inch, 0.8*inch, 2.7*inch)
+
+# Header/grid/padding commands shared by every table; each table only adds
+# its own header and body backgrounds on top. Cell defaults (LEFT alignment,
+# no background) are left implicit so each table resolves fewer commands.
+TABLE_BASE_COMMANDS = [
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('GRID', (0, 0), (-1, -1), 1, GRID_COLOR),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('TOPPADDING', (0, 1), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+]
+
+def table_style_commands(header_bg, body_bg=None):
+    """Return the minimal TableStyle command list for a table with the given backgrounds."""
+    commands = TABLE_BASE_COMMANDS + [('BACKGROUND', (0, 0), (-1, 0), header_bg)]
+    if body_bg is not None:
+        commands.append(('BACKGROUND', (0, 1), (-1, -1), body_bg))
+    return commands
+
+@lru_cache(maxsize=None)
+def create_styles():
+    """Build the paragraph styles once; later calls reuse the cached sheet."""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.pdfbase import pdfmetrics
+
+    # Register the fonts these styles use alongside the styles themselves
+    for font_name in ('Helvetica', 'Helvetica-Bold', 'Courier'):
+        pdfmetrics.getFont(font_name)
 
-def create_deployment_pdf():
-    # Output path
-    output_path = os.path.join(os.path.dirname(__file__), '..', 'docs', 'DEPLOYMENT_DOCUMENTATION.pdf')
-
-    # Create the PDF
-    doc = SimpleDocTemplate(
-        output_path,
-        pagesize=letter,
-        rightMargin=72,
-        leftMargin=72,
-        topMargin=72,
-        bottomMargin=72
-    )
-
-    # Styles
     styles = getSampleStyleSheet()
 
-    # Custom styles
-    title_style = ParagraphStyle(
+    styles.add(ParagraphStyle(
         'CustomTitle',
         parent=styles['Title'],
         fontSize=24,
         spaceAfter=30,
-        textColor=HexColor('#1a1a2e')
-    )
+        textColor=DARK_COLOR
+    ))
 
-    heading1_style = ParagraphStyle(
+    styles.add(ParagraphStyle(
         'CustomHeading1',
         parent=styles['Heading1'],
         fontSize=16,
         spaceBefore=20,
         spaceAfter=12,
-        textColor=HexColor('#16213e')
-    )
+        textColor=NAVY_COLOR
+    ))
 
-    heading2_style = ParagraphStyle(
+    styles.add(ParagraphStyle(
         'CustomHeading2',
         parent=styles['Heading2'],
         fontSize=13,
         spaceBefore=15,
         spaceAfter=8,
-        textColor=HexColor('#0f3460')
-    )
+        textColor=BLUE_COLOR
+    ))
 
-    body_style = ParagraphStyle(
+    styles.add(ParagraphStyle(
         'CustomBody',
         parent=styles['Normal'],
         fontSize=10,
         spaceAfter=8,
         leading=14
-    )
+    ))
 
-    code_style = ParagraphStyle(
-        'Code',
+    styles.add(ParagraphStyle(
+        'CodeBlock',
         parent=styles['Normal'],
         fontSize=9,
         fontName='Courier',
-        backColor=HexColor('#f5f5f5'),
+        backColor=CODE_BG,
         spaceAfter=8,
         leftIndent=20
+    ))
+
+    return styles
+
+def content_hash():
+    """Hash the inputs that determine the document, apart from its date.
+
+    Every word of the document is written out in this file, so the file's
+    source stands in for the content.
+    """
+    digest = hashlib.sha256()
+    with open(__file__, 'rb') as source:
+        digest.update(source.read())
+    digest.update(REPORTLAB_VERSION.encode())
+    return digest.hexdigest()
+
+def embedded_hash(pdf_path):
+    """Return the content-sha256 value from a PDF's Keywords metadata, if any."""
+    try:
+        with open(pdf_path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    match = re.search(rb'/Keywords \(content-sha256:([0-9a-f]{64})\)', data)
+    return match.group(1).decode() if match else None
+
+def create_deployment_pdf(output_path=None, force=False):
+    # Output path
+    if output_path is None:
+        output_path = os.path.join(os.path.dirname(__file__), '..', 'docs', 'DEPLOYMENT_DOCUMENTATION.pdf')
+
+    # Skip the build when the existing PDF was generated from identical inputs
+    digest = content_hash()
+    if not force and embedded_hash(output_path) == digest:
+        print(f"PDF up to date: {output_path}")
+        return output_path
+
+    # platypus dominates reportlab's import time; only load it when building
+    from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, Table, TableStyle, PageBreak
+
+    # Create the PDF from a single explicit Frame/PageTemplate (no First/Later switching)
+    doc = BaseDocTemplate(
+        output_path,
+        pagesize=letter,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=72,
+        pageCompression=0,  # trade file size for a faster build
+        keywords=f'content-sha256:{digest}'
     )
+    frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='normal')
+    doc.addPageTemplates([PageTemplate(id='Page', frames=[frame])])
+
+    styles = create_styles()
 
     # Document content
     story = []
 
     # Title
-    story.append(Paragraph("Jules MCP Server - Deployment Documentation", title_style))
-    story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", body_style))
+    story.append(Paragraph("Jules MCP Server - Deployment Documentation", styles['CustomTitle']))
+    story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", styles['CustomBody']))
     story.append(Spacer(1, 20))
 
     # Domain Migration Section
-    story.append(Paragraph("1. Domain Migration Summary", heading1_style))
+    story.append(Paragraph("1. Domain Migration Summary", styles['CustomHeading1']))
     story.append(Paragraph(
         "This document details the production domain migration from the Render platform URL to the custom Scarmonit domain.",
-        body_style
+        styles['CustomBody']
     ))
 
-    migration_data = [
-        ['Property', 'Previous', 'Current'],
-        ['Production URL', 'antigravity-jules-orchestration.onrender.com', 'scarmonit.com'],
-        ['Health Endpoint', '/health', '/health'],
-        ['MCP Tools Endpoint', '/mcp/tools', '/mcp/tools'],
-        ['MCP Execute Endpoint', '/mcp/execute', '/mcp/execute'],
-        ['SSL/TLS', 'Render Managed', 'Cloudflare Managed'],
-        ['CDN', 'None', 'Cloudflare'],
-    ]
+    migration_data = (
+        ('Property', 'Previous', 'Current'),
+        ('Production URL', 'antigravity-jules-orchestration.onrender.com', 'scarmonit.com'),
+        ('Health Endpoint', '/health', '/health'),
+        ('MCP Tools Endpoint', '/mcp/tools', '/mcp/tools'),
+        ('MCP Execute Endpoint', '/mcp/execute', '/mcp/execute'),
+        ('SSL/TLS', 'Render Managed', 'Cloudflare Managed'),
+        ('CDN', 'None', 'Cloudflare'),
+    )
 
-    migration_table = Table(migration_data, colWidths=[1.5*inch, 2.5*inch, 2*inch])
-    migration_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#1a1a2e')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), HexColor('#f8f9fa')),
-        ('GRID', (0, 0), (-1, -1), 1, HexColor('#dee2e6')),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-    ]))
+    migration_table = Table(migration_data, colWidths=MIGRATION_WIDTHS)
+    migration_table.setStyle(TableStyle(table_style_commands(DARK_COLOR, ROW_BG)))
     story.append(migration_table)
     story.append(Spacer(1, 20))
 
     # Architecture Section
-    story.append(Paragraph("2. Production Architecture", heading1_style))
-
-    arch_data = [
-        ['Layer', 'Technology', 'Purpose'],
-        ['DNS', 'Cloudflare', 'Domain management, SSL termination'],
-        ['CDN/Proxy', 'Cloudflare', 'DDoS protection, caching, edge routing'],
-        ['Hosting', 'Render', 'Container hosting, auto-deploy'],
-        ['Runtime', 'Node.js 18+', 'MCP server execution'],
-        ['API', 'Express.js', 'HTTP endpoints, routing'],
-        ['External', 'Google Jules API', 'AI coding sessions'],
-    ]
+    story.append(Paragraph("2. Production Architecture", styles['CustomHeading1']))
+
+    arch_data = (
+        ('Layer', 'Technology', 'Purpose'),
+        ('DNS', 'Cloudflare', 'Domain management, SSL termination'),
+        ('CDN/Proxy', 'Cloudflare', 'DDoS protection, caching, edge routing'),
+        ('Hosting', 'Render', 'Container hosting, auto-deploy'),
+        ('Runtime', 'Node.js 18+', 'MCP server execution'),
+        ('API', 'Express.js', 'HTTP endpoints, routing'),
+        ('External', 'Google Jules API', 'AI coding sessions'),
+    )
 
-    arch_table = Table(arch_data, colWidths=[1.5*inch, 1.8*inch, 2.7*inch])
-    arch_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#16213e')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), HexColor('#ffffff')),
-        ('GRID', (0, 0), (-1, -1), 1, HexColor('#dee2e6')),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-    ]))
+    arch_table = Table(arch_data, colWidths=ARCH_WIDTHS)
+    arch_table.setStyle(TableStyle(table_style_commands(NAVY_COLOR)))
     story.append(arch_table)
     story.append(Spacer(1, 20))
 
     # API Endpoints Section
-    story.append(Paragraph("3. API Endpoints", heading1_style))
+    story.append(Paragraph("3. API Endpoints", styles['CustomHeading1']))
 
-    story.append(Paragraph("3.1 Health Check", heading2_style))
-    story.append(Paragraph("GET https://scarmonit.com/health", code_style))
+    story.append(Paragraph("3.1 Health Check", styles['CustomHeading2']))
+    story.append(Paragraph("GET https://scarmonit.com/health", styles['CodeBlock']))
     story.append(Paragraph(
         "Returns server health status, version, and configuration state. Used for monitoring and load balancer health checks.",
-        body_style
+        styles['CustomBody']
     ))
 
-    story.append(Paragraph("3.2 MCP Tools List", heading2_style))
-    story.append(Paragraph("GET https://scarmonit.com/mcp/tools", code_style))
+    story.append(Paragraph("3.2 MCP Tools List", styles['CustomHeading2']))
+    story.append(Paragraph("GET https://scarmonit.com/mcp/tools", styles['CodeBlock']))
     story.append(Paragraph(
         "Returns list of available MCP tools: jules_list_sources, jules_create_session, jules_list_sessions, jules_get_session, jules_send_message, jules_approve_plan, jules_get_activities.",
-        body_style
+        styles['CustomBody']
     ))
 
-    story.append(Paragraph("3.3 MCP Execute", heading2_style))
-    story.append(Paragraph("POST https://scarmonit.com/mcp/execute", code_style))
+    story.append(Paragraph("3.3 MCP Execute", styles['CustomHeading2']))
+    story.append(Paragraph("POST https://scarmonit.com/mcp/execute", styles['CodeBlock']))
     story.append(Paragraph(
         "Executes MCP tools. Requires X-API-Key header for write operations. Request body: {tool: string, parameters: object}.",
-        body_style
+        styles['CustomBody']
     ))
 
     story.append(PageBreak())
 
     # Configuration Section
-    story.append(Paragraph("4. Environment Configuration", heading1_style))
-
-    env_data = [
-        ['Variable', 'Required', 'Description'],
-        ['JULES_API_KEY', 'Yes', 'Google Jules API authentication key'],
-        ['GOOGLE_APPLICATION_CREDENTIALS_JSON', 'Alt', 'Service account JSON (alternative to API key)'],
-        ['PORT', 'No', 'Server port (default: 3323)'],
-        ['ALLOWED_ORIGINS', 'No', 'CORS allowed origins (comma-separated)'],
-        ['NODE_ENV', 'No', 'Environment (production/development)'],
-    ]
+    story.append(Paragraph("4. Environment Configuration", styles['CustomHeading1']))
+
+    env_data = (
+        ('Variable', 'Required', 'Description'),
+        ('JULES_API_KEY', 'Yes', 'Google Jules API authentication key'),
+        ('GOOGLE_APPLICATION_CREDENTIALS_JSON', 'Alt', 'Service account JSON (alternative to API key)'),
+        ('PORT', 'No', 'Server port (default: 3323)'),
+        ('ALLOWED_ORIGINS', 'No', 'CORS allowed origins (comma-separated)'),
+        ('NODE_ENV', 'No', 'Environment (production/development)'),
+    )
 
-    env_table = Table(env_data, colWidths=[2.5*inch, 0.8*inch, 2.7*inch])
-    env_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#0f3460')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), HexColor('#f8f9fa')),
-        ('GRID', (0, 0), (-1, -1), 1, HexColor('#dee2e6')),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-    ]))
+    env_table = Table(env_data, colWidths=ENV_WIDTHS)
+    env_table.setStyle(TableStyle(table_style_commands(BLUE_COLOR, ROW_BG)))
     story.append(env_table)
     story.append(Spacer(1, 20))
 
     # Files Updated Section
-    story.append(Paragraph("5. Files Updated in Migration", heading1_style))
+    story.append(Paragraph("5. Files Updated in Migration", styles['CustomHeading1']))
     story.append(Paragraph(
         "The following files were updated to reference the new production domain (scarmonit.com):",
-        body_style
+        styles['CustomBody']
     ))
 
     files_updated = [
@@ -222,45 +271,44 @@ def create_deployment_pdf():
         "docs/*.md - Documentation files (8 files)",
     ]
 
-    for f in files_updated:
-        story.append(Paragraph(f"  - {f}", body_style))
+    story.append(Paragraph("<br/>".join(f"  - {f}" for f in files_updated), styles['CustomBody']))
 
     story.append(Spacer(1, 20))
 
     # Verification Section
-    story.append(Paragraph("6. Deployment Verification", heading1_style))
+    story.append(Paragraph("6. Deployment Verification", styles['CustomHeading1']))
 
-    story.append(Paragraph("6.1 Health Check Verification", heading2_style))
-    story.append(Paragraph("curl https://scarmonit.com/health", code_style))
-    story.append(Paragraph('Expected: {"status":"ok","version":"2.3.0",...}', body_style))
+    story.append(Paragraph("6.1 Health Check Verification", styles['CustomHeading2']))
+    story.append(Paragraph("curl https://scarmonit.com/health", styles['CodeBlock']))
+    story.append(Paragraph('Expected: {"status":"ok","version":"2.3.0",...}', styles['CustomBody']))
 
-    story.append(Paragraph("6.2 MCP Tools Verification", heading2_style))
-    story.append(Paragraph("curl https://scarmonit.com/mcp/tools", code_style))
-    story.append(Paragraph('Expected: {"tools":[...7 jules tools...]}', body_style))
+    story.append(Paragraph("6.2 MCP Tools Verification", styles['CustomHeading2']))
+    story.append(Paragraph("curl https://scarmonit.com/mcp/tools", styles['CodeBlock']))
+    story.append(Paragraph('Expected: {"tools":[...7 jules tools...]}', styles['CustomBody']))
 
-    story.append(Paragraph("6.3 SSL/TLS Verification", heading2_style))
-    story.append(Paragraph("curl -I https://scarmonit.com", code_style))
-    story.append(Paragraph('Expected: HTTP/2 200, valid SSL certificate from Cloudflare', body_style))
+    story.append(Paragraph("6.3 SSL/TLS Verification", styles['CustomHeading2']))
+    story.append(Paragraph("curl -I https://scarmonit.com", styles['CodeBlock']))
+    story.append(Paragraph('Expected: HTTP/2 200, valid SSL certificate from Cloudflare', styles['CustomBody']))
 
     story.append(Spacer(1, 20))
 
     # Contact Section
-    story.append(Paragraph("7. Support & Monitoring", heading1_style))
+    story.append(Paragraph("7. Support & Monitoring", styles['CustomHeading1']))
     story.append(Paragraph(
         "Production URL: https://scarmonit.com",
-        body_style
+        styles['CustomBody']
     ))
     story.append(Paragraph(
         "Health Dashboard: https://dashboard.render.com",
-        body_style
+        styles['CustomBody']
     ))
     story.append(Paragraph(
         "DNS Management: https://dash.cloudflare.com",
-        body_style
+        styles['CustomBody']
     ))
     story.append(Paragraph(
         "Repository: https://github.com/scarmonit/antigravity-jules-orchestration",
-        body_style
+        styles['CustomBody']
     ))
 
     # Build the PDF
@@ -269,4 +317,4 @@ def create_deployment_pdf():
     return output_path
 
 if __name__ == "__main__":
-    create_deployment_pdf()
+    create_deployment_pdf(force='--force' in sys.argv[1:])